@@ -1,6 +1,7 @@
 """Support for PlayStation 5 consoles."""
+import asyncio
+import functools
 import logging
-import os
 
 from psremoteplay.ddp import async_create_ddp_endpoint
 from psremoteplay.media_art import COUNTRIES
@@ -17,8 +18,9 @@ from homeassistant.const import (
     ATTR_LOCKED,
     CONF_REGION,
     CONF_TOKEN,
+    EVENT_HOMEASSISTANT_STOP,
 )
-from homeassistant.core import HomeAssistant, split_entity_id
+from homeassistant.core import HomeAssistant, callback, split_entity_id
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv, entity_registry
 from homeassistant.util import location
@@ -31,6 +33,7 @@ from .const import (
     COUNTRYCODE_NAMES,
     DOMAIN,
     GAMES_FILE,
+    GAMES_SAVE_DELAY,
     PS5_DATA,
 )
 
@@ -47,6 +50,13 @@ PS5_COMMAND_SCHEMA = vol.Schema(
 
 PLATFORMS = ["media_player"]
 
+_DEFAULT_GAME_ENTRY = {
+    ATTR_LOCKED: False,
+    ATTR_MEDIA_TITLE: None,
+    ATTR_MEDIA_IMAGE_URL: None,
+    ATTR_MEDIA_CONTENT_TYPE: MEDIA_TYPE_GAME,
+}
+
 
 class PS5Data:
     """Init Data Class."""
@@ -55,6 +65,9 @@ class PS5Data:
         """Init Class."""
         self.devices = []
         self.protocol = None
+        self.games = {}
+        self.pending_saves = {}
+        self.country = None
 
 
 async def async_setup(hass, config):
@@ -65,6 +78,18 @@ async def async_setup(hass, config):
     hass.data[PS5_DATA].protocol = protocol
     _LOGGER.debug("PS5 DDP endpoint created: %s, %s", transport, protocol)
     service_handle(hass)
+
+    async def async_flush_pending_saves(event):
+        """Write any pending games files on shutdown."""
+        pending = hass.data[PS5_DATA].pending_saves
+        jobs = []
+        for unique_id, handle in list(pending.items()):
+            handle.cancel()
+            jobs.append(_async_flush_games(hass, unique_id))
+        if jobs:
+            await asyncio.gather(*jobs)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_flush_pending_saves)
     return True
 
 
@@ -94,11 +119,15 @@ async def async_migrate_entry(hass, entry):
 
     # Migrate Version 1 -> Version 2: New region codes.
     if version == 1:
-        loc = await location.async_detect_location_info(
-            hass.helpers.aiohttp_client.async_get_clientsession()
-        )
-        if loc:
-            country = COUNTRYCODE_NAMES.get(loc.country_code)
+        devices = data.get("devices")
+        # Nothing to convert; skip the location lookup.
+        if not devices or all(
+            device.get(CONF_REGION) in COUNTRIES for device in devices
+        ):
+            version = entry.version = 2
+            config_entries.async_update_entry(entry, data=data)
+        else:
+            country = await _async_detect_country(hass)
             if country in COUNTRIES:
                 for device in data["devices"]:
                     device[CONF_REGION] = country
@@ -156,6 +185,24 @@ async def async_migrate_entry(hass, entry):
     return False
 
 
+async def _async_detect_country(hass: HomeAssistant):
+    """Return country name for the detected location. Cached once found."""
+    ps5_data = hass.data.get(PS5_DATA)
+    if ps5_data is not None and ps5_data.country is not None:
+        return ps5_data.country
+
+    loc = await location.async_detect_location_info(
+        hass.helpers.aiohttp_client.async_get_clientsession()
+    )
+    if not loc:
+        return None
+    country = COUNTRYCODE_NAMES.get(loc.country_code)
+    if ps5_data is not None:
+        ps5_data.country = country
+    return country
+
+
+@functools.lru_cache(maxsize=64)
 def format_unique_id(creds, mac_address):
     """Use last 4 Chars of credential as suffix. Unique ID per PSN user."""
     suffix = creds[-4:]
@@ -164,24 +211,55 @@ def format_unique_id(creds, mac_address):
 
 def load_games(hass: HomeAssistant, unique_id: str) -> dict:
     """Load games for sources."""
+    cache = hass.data[PS5_DATA].games
+    if unique_id in cache:
+        return cache[unique_id]
+
     g_file = hass.config.path(GAMES_FILE.format(unique_id))
+    # Only cache a successful load so a failed one is retried next time.
     try:
         games = load_json(g_file)
     except HomeAssistantError as error:
-        games = {}
         _LOGGER.error("Failed to load games file: %s", error)
+        return {}
 
     if not isinstance(games, dict):
         _LOGGER.error("Games file was not parsed correctly")
-        games = {}
+        return {}
 
-    # If file exists
-    if os.path.isfile(g_file):
-        games = _reformat_data(hass, games, unique_id)
+    games = _reformat_data(hass, games, unique_id)
+    cache[unique_id] = games
     return games
 
 
 def save_games(hass: HomeAssistant, games: dict, unique_id: str):
+    """Schedule games to be saved to file. Safe to call from any thread."""
+    hass.data[PS5_DATA].games[unique_id] = games
+    hass.loop.call_soon_threadsafe(_async_schedule_save, hass, unique_id)
+
+
+@callback
+def _async_schedule_save(hass: HomeAssistant, unique_id: str):
+    """Coalesce writes for unique_id into one delayed write."""
+    pending = hass.data[PS5_DATA].pending_saves
+    handle = pending.get(unique_id)
+    if handle is not None:
+        handle.cancel()
+    pending[unique_id] = hass.loop.call_later(
+        GAMES_SAVE_DELAY, _async_flush_games, hass, unique_id
+    )
+
+
+@callback
+def _async_flush_games(hass: HomeAssistant, unique_id: str) -> asyncio.Future:
+    """Write the latest games for unique_id in the executor."""
+    data = hass.data[PS5_DATA]
+    data.pending_saves.pop(unique_id, None)
+    games = dict(data.games.get(unique_id, {}))
+    return hass.async_add_executor_job(_write_games, hass, games, unique_id)
+
+
+def _write_games(hass: HomeAssistant, games: dict, unique_id: str):
     """Save games to file."""
     g_file = hass.config.path(GAMES_FILE.format(unique_id))
     try:
@@ -192,24 +270,20 @@ def save_games(hass: HomeAssistant, games: dict, unique_id: str):
 
 def _reformat_data(hass: HomeAssistant, games: dict, unique_id: str) -> dict:
     """Reformat data to correct format."""
-    data_reformatted = False
+    if all(isinstance(data, dict) for data in games.values()):
+        return games
 
-    for game, data in games.items():
+    for game, data in list(games.items()):
         # Convert str format to dict format.
         if not isinstance(data, dict):
             # Use existing title. Assign defaults.
-            games[game] = {
-                ATTR_LOCKED: False,
-                ATTR_MEDIA_TITLE: data,
-                ATTR_MEDIA_IMAGE_URL: None,
-                ATTR_MEDIA_CONTENT_TYPE: MEDIA_TYPE_GAME,
-            }
-            data_reformatted = True
+            entry = _DEFAULT_GAME_ENTRY.copy()
+            entry[ATTR_MEDIA_TITLE] = data
+            games[game] = entry
 
             _LOGGER.debug("Reformatting media data for item: %s, %s", game, data)
 
-    if data_reformatted:
-        save_games(hass, games, unique_id)
+    save_games(hass, games, unique_id)
     return games
 
 
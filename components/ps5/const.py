@@ -6,6 +6,7 @@ DEFAULT_REGION = "Brazil"
 DEFAULT_ALIAS = "Home-Assistant"
 DOMAIN = "ps5"
 GAMES_FILE = ".ps5-games.{}.json"
+GAMES_SAVE_DELAY = 1
 PS5_DATA = "ps5_data"
 
 COMMANDS = ("up", "down", "right", "left", "enter", "back", "option", "ps", "ps_hold")
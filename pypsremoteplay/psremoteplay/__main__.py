@@ -3,7 +3,6 @@
 import curses
 import logging
 import time
-from collections import OrderedDict
 
 import click
 
@@ -14,16 +13,19 @@ from .ps5 import NotReady, Ps5Legacy
 
 _LOGGER = logging.getLogger(__name__)
 
+STATUS_INTERVAL = 5
+
+# Color pair attributes. Filled once curses colors are initialized.
+COLORS = []
+
 
 def _get_ps5(
+    helper,
     ip_address=None,
     credentials=None,
     no_creds=False,
     port=DEFAULT_UDP_PORT
 ):
-
-    helper = Helper()
-
     if credentials is None:
         data = helper.load_files('credentials')
         credentials = data.get('credentials')
@@ -36,13 +38,13 @@ def _get_ps5(
     if ip_address is not None and credentials is not None:
         return Ps5Legacy(ip_address, credentials, port=port)
 
-    helper = Helper()
     is_data = helper.check_data('ps5')
     if not is_data:
         prompt_configure = input(
             "No configuration found. Configure? Enter 'y' for yes.\n> ")
         if prompt_configure.lower() == 'y':
-            _link_func(ip_address=None, credentials=None, port=port)
+            _link_func(
+                helper, ip_address=None, credentials=None, port=port)
         return None
     data = helper.load_files('ps5')
     if len(data) > 1 and ip_address is None:
@@ -58,8 +60,7 @@ def _get_ps5(
     return _ps5
 
 
-def _check_creds(credentials):
-    helper = Helper()
+def _check_creds(helper, credentials):
     existing_creds = False
     if credentials is None:
         _data = helper.load_files('credentials')
@@ -67,7 +68,7 @@ def _check_creds(credentials):
 
         if credentials is not None:
             existing_creds = True
-        _credentials = _credentials_func()
+        _credentials = _credentials_func(helper)
         if _credentials is None:
             if existing_creds:
                 print('Using existing credentials.')
@@ -121,6 +122,7 @@ def cli(ctx=None, debug=False, port=DEFAULT_UDP_PORT):
 
     ctx.obj = {}
     ctx.obj['port'] = port
+    ctx.obj['helper'] = Helper()
     print("Using local UDP port: {}".format(port))
 
 
@@ -132,7 +134,8 @@ def cli(ctx=None, debug=False, port=DEFAULT_UDP_PORT):
 @click.option('-c', '--credentials')
 def wakeup(ctx, ip_address=None, credentials=None):
     """Wakeup PS5"""
-    _ps5 = _get_ps5(ip_address, credentials, port=ctx.obj['port'])
+    _ps5 = _get_ps5(
+        ctx.obj['helper'], ip_address, credentials, port=ctx.obj['port'])
     if _ps5 is not None:
         _ps5.wakeup()
         print("Wakeup Sent to {}".format(_ps5.host))
@@ -146,7 +149,8 @@ def wakeup(ctx, ip_address=None, credentials=None):
 @click.option('-c', '--credentials')
 def standby(ctx, ip_address=None, credentials=None):
     """Standby."""
-    _ps5 = _get_ps5(ip_address, credentials, port=ctx.obj['port'])
+    _ps5 = _get_ps5(
+        ctx.obj['helper'], ip_address, credentials, port=ctx.obj['port'])
     if _ps5 is not None:
         success = _ps5.standby()
         _print_result(success, 'Standby')
@@ -161,7 +165,8 @@ def standby(ctx, ip_address=None, credentials=None):
 @click.argument('command', required=True)
 def remote(ctx, command, ip_address=None, credentials=None):
     """Send remote control."""
-    _ps5 = _get_ps5(ip_address, credentials, port=ctx.obj['port'])
+    _ps5 = _get_ps5(
+        ctx.obj['helper'], ip_address, credentials, port=ctx.obj['port'])
     if _ps5 is not None:
         success = _ps5.remote_control(command)
         _print_result(success, "Remote '{}'".format(command))
@@ -176,7 +181,8 @@ def remote(ctx, command, ip_address=None, credentials=None):
 @click.argument('title_id', required=True)
 def start(ctx, title_id, ip_address=None, credentials=None):
     """Start Title."""
-    _ps5 = _get_ps5(ip_address, credentials, port=ctx.obj['port'])
+    _ps5 = _get_ps5(
+        ctx.obj['helper'], ip_address, credentials, port=ctx.obj['port'])
     if _ps5 is not None:
         print("Starting title: {}".format(title_id))
         success = _ps5.start_title(title_id)
@@ -191,17 +197,17 @@ def start(ctx, title_id, ip_address=None, credentials=None):
 @click.option('-c', '--credentials')
 def link(ctx, ip_address=None, credentials=None):
     """Link or register device with PS5."""
-    _link_func(ip_address, credentials, port=ctx.obj['port'])
+    _link_func(
+        ctx.obj['helper'], ip_address, credentials, port=ctx.obj['port'])
 
 
 # pylint: disable=too-many-return-statements
-def _link_func(ip_address, credentials, port):
-    helper = Helper()
-    credentials = _check_creds(credentials)
+def _link_func(helper, ip_address, credentials, port):
+    credentials = _check_creds(helper, credentials)
     if credentials is None:
         return False
 
-    device_list = _search_func(port=port)
+    device_list = _search_func(helper, port=port)
     if not device_list:
         return False
     if ip_address not in device_list and ip_address is not None:
@@ -247,11 +253,10 @@ def _link_func(ip_address, credentials, port):
 def search(ctx) -> list:
     """Search LAN for PS5's."""
     port = ctx.obj['port']
-    _search_func(port)
+    _search_func(ctx.obj['helper'], port)
 
 
-def _search_func(port=DEFAULT_UDP_PORT):
-    helper = Helper()
+def _search_func(helper, port=DEFAULT_UDP_PORT):
     devices = helper.has_devices(port=port)
     device_list = [device["host-ip"] for device in devices]
     print("Found {} devices:".format(len(device_list)))
@@ -267,10 +272,10 @@ def _search_func(port=DEFAULT_UDP_PORT):
 def status(ctx, ip_address=None):
     """Get Status of PS5."""
     port = ctx.obj['port']
+    helper = ctx.obj['helper']
     d_status = {}
     if ip_address is None:
         print("Getting status for any...")
-        helper = Helper()
         devices = helper.has_devices(ip_address, port=port)
         if devices:
             for d_status in devices:
@@ -279,6 +284,7 @@ def status(ctx, ip_address=None):
         print("Try using --ip_address option.")
     else:
         _ps5 = _get_ps5(
+            helper,
             ip_address=ip_address,
             credentials=None,
             no_creds=True,
@@ -297,13 +303,13 @@ def status(ctx, ip_address=None):
 
 
 @cli.command(help='Get PSN Credentials. Example: psremoteplay credentials ')
-def credential():
+@click.pass_context
+def credential(ctx):
     """Get and save credentials."""
-    _credentials_func()
+    _credentials_func(ctx.obj['helper'])
 
 
-def _credentials_func():
-    helper = Helper()
+def _credentials_func(helper):
     is_creds = helper.check_data('credentials')
     if is_creds:
         if not _overwrite_creds():
@@ -339,13 +345,14 @@ def _credentials_func():
 @click.option('-c', '--credentials')
 def interactive(ctx, ip_address=None, credentials=None):
     """Interactive."""
-    _ps5 = _get_ps5(ip_address, credentials, port=ctx.obj['port'])
+    _ps5 = _get_ps5(
+        ctx.obj['helper'], ip_address, credentials, port=ctx.obj['port'])
     if _ps5 is not None:
-        curses.wrapper(_interactive, _ps5)
+        curses.wrapper(_interactive, _ps5, ctx.obj['helper'])
 
 
 # pylint: disable=no-member
-def _interactive(stdscr, ps5):
+def _interactive(stdscr, ps5, helper):
     key_mapping = {
         'W': ('wakeup', ps5.wakeup),
         'S': ('standby', ps5.standby),
@@ -368,10 +375,13 @@ def _interactive(stdscr, ps5):
     curses.init_pair(3, curses.COLOR_MAGENTA, curses.COLOR_BLACK)
     curses.init_pair(4, curses.COLOR_YELLOW, curses.COLOR_BLACK)
     curses.init_pair(5, curses.COLOR_GREEN, curses.COLOR_BLACK)
+    COLORS[:] = [curses.color_pair(index) for index in range(6)]
+    # Labels do not change while running; build them once.
+    mapping_render = _get_mapping_render(key_mapping)
     ps5.auto_close = False
     _status = ps5.get_status()
-    _handle_status(stdscr, _status, key_mapping)
-    _run(stdscr, ps5, key_mapping)
+    _handle_status(stdscr, _status, mapping_render, helper)
+    _run(stdscr, ps5, key_mapping, mapping_render, helper)
     ps5.close()
 
 
@@ -379,11 +389,11 @@ def _interactive(stdscr, ps5):
 def _write_str(
         stdscr, text, color=1):
     stdscr.clrtoeol()
-    stdscr.addstr(text, curses.color_pair(color))
+    stdscr.addstr(text, COLORS[color])
 
 
 # pylint: disable=no-member
-def _init_window(stdscr, _status, key_mapping):
+def _init_window(stdscr, _status, mapping_render):
     stdscr.addstr(
         0, 0,
         "Interactive mode, press 'q' to exit\n",
@@ -399,24 +409,24 @@ def _init_window(stdscr, _status, key_mapping):
                 _status.get('status'),
                 _status.get('running-app-name'),
                 _status.get('running-app-titleid'),
-            ), curses.color_pair(2))
+            ), COLORS[2])
     else:
         stdscr.addstr(
             1, 0,
             "Status: {}\n".format('Not Available'),
-            curses.color_pair(3))
-    _show_mapping(stdscr, key_mapping)
+            COLORS[3])
+    _show_mapping(stdscr, mapping_render)
     win_size = stdscr.getmaxyx()
     stdscr.setscrreg(stdscr.getyx()[0], win_size[0] - 1)
-    stdscr.refresh()
+    stdscr.noutrefresh()
+    curses.doupdate()
 
 
-def _show_mapping(stdscr, key_mapping):
-    item = 3
-    _key_mapping = OrderedDict()
-    _key_mapping.update({'Key': ['Action']})
-    _key_mapping.update(key_mapping)
+def _get_mapping_render(key_mapping):
+    """Return list of (key, action) labels to display."""
+    _key_mapping = {'Key': ('Action',), **key_mapping}
 
+    mapping_render = []
     for key, values in _key_mapping.items():
         if key == '\n':
             key = 'KEY_ENTER'
@@ -424,9 +434,17 @@ def _show_mapping(stdscr, key_mapping):
             value = values[2]
         else:
             value = values[0]
-        _write_str(stdscr, key, 5)
+        mapping_render.append((key, value))
+    return mapping_render
+
+
+def _show_mapping(stdscr, mapping_render):
+    # Writing '\n' clears the rest of the line, so no clrtoeol per cell.
+    item = 3
+    for key, value in mapping_render:
+        stdscr.addstr(key, COLORS[5])
         stdscr.addstr(' : ')
-        _write_str(stdscr, value, 4)
+        stdscr.addstr(value, COLORS[4])
         item += 1
         if item >= 4:
             item = 0
@@ -436,8 +454,7 @@ def _show_mapping(stdscr, key_mapping):
     stdscr.addstr('\n\n')
 
 
-def _handle_status(stdscr, _status, key_mapping):
-    helper = Helper()
+def _handle_status(stdscr, _status, mapping_render, helper):
     games = helper.load_files('games')
     _write_str(
         stdscr,
@@ -449,26 +466,13 @@ def _handle_status(stdscr, _status, key_mapping):
             games[title_id] = _status.get('running-app-name')
             helper.save_files(games, 'games')
     cur_pos = stdscr.getyx()
-    _init_window(stdscr, _status, key_mapping)
+    _init_window(stdscr, _status, mapping_render)
     stdscr.move(cur_pos[0], cur_pos[1])
 
 
-def _show_game_mapping():
-    mapping = {}
-    helper = Helper()
-    games = helper.load_files('games')
-    if games:
-        g_index = 1
-        mapping['0'] = ('', 'Cancel')
-        for key, value in games.items():
-            mapping[str(g_index)] = (key, value)
-            g_index += 1
-    return mapping
-
-
-def _get_title_map(stdscr):
+def _get_title_map(stdscr, helper):
     stdscr.nodelay(False)
-    mapping = _show_game_mapping()
+    mapping = helper.get_title_mapping()
     if mapping:
         _write_str(
             stdscr,
@@ -484,7 +488,7 @@ def _get_title_map(stdscr):
     return mapping
 
 
-def _handle_require_on(stdscr, mapping):
+def _handle_require_on(stdscr, mapping, helper):
     fail = False
     action = mapping[0]
     command = mapping[1]
@@ -494,7 +498,7 @@ def _handle_require_on(stdscr, mapping):
             arg = mapping[2]
             command(arg)
         elif action == 'start_title':
-            mapping = _get_title_map(stdscr)
+            mapping = _get_title_map(stdscr, helper)
             title_index = stdscr.getkey()
             if title_index != '0':
                 try:
@@ -523,7 +527,7 @@ def _handle_require_on(stdscr, mapping):
 
 
 # pylint: disable=no-member
-def _handle_key(stdscr, key, key_mapping):
+def _handle_key(stdscr, key, key_mapping, helper):
     fail = False
     arg = ''
 
@@ -540,38 +544,45 @@ def _handle_key(stdscr, key, key_mapping):
         elif action == 'wakeup':
             command()
         else:
-            fail, arg = _handle_require_on(stdscr, mapping)
-        if not fail and action != 'status_request':
+            fail, arg = _handle_require_on(stdscr, mapping, helper)
+        if fail:
+            # Keys queued behind a failed command are stale.
+            curses.flushinp()
+        elif action != 'status_request':
             _write_str(
                 stdscr,
                 '> Sent {}: {}\n'.format(action, arg), 5)
-    curses.flushinp()
     return True
 
 
 # pylint: disable=no-member
-def _run(stdscr, ps5, key_mapping):
+def _run(stdscr, ps5, key_mapping, mapping_render, helper):
     _status = ps5.get_status()
     stdscr.scrollok(True)
-    _init_window(stdscr, _status, key_mapping)
+    _init_window(stdscr, _status, mapping_render)
     running = True
     key = None
-    start_timer = 0
+    last_refresh = None
     while running:
-        stdscr.nodelay(True)
-        if time.time() - start_timer > 5:
-            start_timer = time.time()
+        now = time.monotonic()
+        if last_refresh is None or now - last_refresh > STATUS_INTERVAL:
+            last_refresh = now
             if ps5.loggedin:
                 ps5.send_status()
             new_status = ps5.get_status()
             if _status != new_status:
                 _status = new_status
                 if _status is not None:
-                    _handle_status(stdscr, _status, key_mapping)
+                    _handle_status(
+                        stdscr, _status, mapping_render, helper)
+        # Block in getkey until a key is pressed or a refresh is due.
+        remaining = STATUS_INTERVAL - (now - last_refresh)
+        stdscr.timeout(max(int(remaining * 1000), 0))
         try:
             key = stdscr.getkey()
-            running = _handle_key(stdscr, key, key_mapping)
+            running = _handle_key(stdscr, key, key_mapping, helper)
         except curses.error:
+            # Timed out; refresh status on the next pass.
             pass
 
 
@@ -3,9 +3,9 @@
 from __future__ import print_function
 
 import asyncio
+import functools
 import logging
 import re
-import select
 import socket
 import time
 from typing import Optional
@@ -27,6 +27,20 @@ DEFAULT_STANDBY_DELAY = 50
 STATUS_OK = 200
 STATUS_STANDBY = 620
 
+_RE_STATUS = re.compile(rb'HTTP/1\.1 (\d+) (.*)')
+_SEARCH_PREFIX = DDP_TYPE_SEARCH.encode('ascii')
+_STATUS_PREFIX = b'HTTP/1.1 '
+
+# Fixed schema shared by WAKEUP and LAUNCH messages.
+_CREDENTIAL_MSG_TEMPLATE = (
+    '{msg_type} * HTTP/1.1\n'
+    'user-credential:{credential}\n'
+    'client-type:a\n'
+    'auth-type:C\n'
+    'device-discovery-protocol-version:' + DDP_VERSION + '\n'
+)
+
+
 class DDPProtocol(asyncio.DatagramProtocol):
     """Async UDP Client."""
 
@@ -36,6 +50,9 @@ class DDPProtocol(asyncio.DatagramProtocol):
         self.callbacks = {}
         self.max_polls = max_polls
         self._transport = None
+        self._loop = None
+        self._sock = None
+        self._sockname = None
         self._remote_port = DDP_PORT
         self._local_port = UDP_PORT
         self._message = get_ddp_search_message()
@@ -62,28 +79,30 @@ class DDPProtocol(asyncio.DatagramProtocol):
     def connection_made(self, transport):
         """On Connection."""
         self._transport = transport
-        sock = self._transport.get_extra_info('socket')
-        self._local_port = sock.getsockname()[1]
+        self._loop = asyncio.get_event_loop()
+        self._sock = transport.get_extra_info('socket')
+        self._sockname = self._sock.getsockname()
+        self._local_port = self._sockname[1]
         _LOGGER.debug("PS5 Transport created with port: %s", self.local_port)
 
     def send_msg(self, ps5, message=None):
         """Send Message."""
         # PS5 won't respond to polls right after standby
-        if self.polls_disabled:
-            elapsed = time.time() - self._standby_start
-            seconds = DEFAULT_STANDBY_DELAY - elapsed
-            _LOGGER.debug("Polls disabled for %s seconds", round(seconds, 2))
-            return
-        self._standby_start = 0
+        if self._standby_start:
+            elapsed = time.monotonic() - self._standby_start
+            if elapsed < DEFAULT_STANDBY_DELAY:
+                seconds = DEFAULT_STANDBY_DELAY - elapsed
+                _LOGGER.debug(
+                    "Polls disabled for %s seconds", round(seconds, 2))
+                return
+            self._standby_start = 0
         if message is None:
             message = self._message
-        sock = self._transport.get_extra_info('socket')
-        _LOGGER.debug(
-            "SENT MSG @ DDP Proto SPORT=%s DEST=%s",
-            sock.getsockname()[1], (ps5.host, self._remote_port))
-        self._transport.sendto(
-            message.encode('utf-8'),
-            (ps5.host, self._remote_port))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "SENT MSG @ DDP Proto SPORT=%s DEST=%s",
+                self._sockname[1], (ps5.host, self._remote_port))
+        self._transport.sendto(message, (ps5.host, self._remote_port))
 
         # Track polls that were never returned.
         ps5.poll_count += 1
@@ -94,44 +113,44 @@ class DDPProtocol(asyncio.DatagramProtocol):
                 _LOGGER.info("PS5 @ %s is unreachable", ps5.host)
                 ps5.unreachable = True
             ps5.status = None
-            if ps5.host in self.callbacks:
-                callback = self.callbacks[ps5.host].get(ps5)
-                if callback is not None:
-                    callback()
+            callback = self.get_callback(ps5)
+            if callback is not None:
+                callback()
 
     def datagram_received(self, data, addr):
         """When data is received."""
         if data is not None:
-            sock = self._transport.get_extra_info('socket')
-            _LOGGER.debug(
-                "RECV MSG @ DDP Proto DPORT=%s SRC=%s",
-                sock.getsockname()[1], addr)
-            self._handle(data, addr)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "RECV MSG @ DDP Proto DPORT=%s SRC=%s",
+                    self._sockname[1], addr)
+            # Parse outside of the protocol callback so the socket is
+            # drained quickly when many responses arrive at once.
+            self._loop.call_soon(self._handle, data, addr)
 
     def _handle(self, data, addr):
-        data = parse_ddp_response(data.decode('utf-8'))
+        data = parse_ddp_response(data)
         data[u'host-ip'] = addr[0]
 
         address = addr[0]
 
-        if address in self.callbacks:
-            for ps5, callback in self.callbacks[address].items():
-                ps5.poll_count = 0
-                ps5.unreachable = False
-                old_status = ps5.status
-                ps5.status = data
-                if old_status != data:
-                    _LOGGER.debug("Status: %s", ps5.status)
-                    callback()
-                    # Status changed from OK to Standby/Turned Off
-                    if old_status is not None and \
-                            old_status.get('status_code') == STATUS_OK and \
-                            ps5.status.get('status_code') == STATUS_STANDBY:
-                        self._standby_start = time.time()
-                        _LOGGER.debug(
-                            "Status changed from OK to Standby."
-                            "Disabling polls for %s seconds",
-                            DEFAULT_STANDBY_DELAY)
+        for ps5, callback in self.callbacks.get(address, ()):
+            ps5.poll_count = 0
+            ps5.unreachable = False
+            old_status = ps5.status
+            ps5.status = data
+            if old_status != data:
+                _LOGGER.debug("Status: %s", ps5.status)
+                callback()
+                # Status changed from OK to Standby/Turned Off
+                if old_status is not None and \
+                        old_status.get('status_code') == STATUS_OK and \
+                        ps5.status.get('status_code') == STATUS_STANDBY:
+                    self._standby_start = time.monotonic()
+                    _LOGGER.debug(
+                        "Status changed from OK to Standby."
+                        "Disabling polls for %s seconds",
+                        DEFAULT_STANDBY_DELAY)
 
     def connection_lost(self, exc):
         """On Connection Lost."""
@@ -153,19 +172,31 @@ class DDPProtocol(asyncio.DatagramProtocol):
 
     def add_callback(self, ps5, callback):
         """Add callback to list. One per PS5 Object."""
-        if ps5.host not in self.callbacks:
-            self.callbacks[ps5.host] = {}
-        self.callbacks[ps5.host][ps5] = callback
+        callbacks = self.callbacks.setdefault(ps5.host, [])
+        for index, (_ps5, _) in enumerate(callbacks):
+            if _ps5 is ps5:
+                callbacks[index] = (ps5, callback)
+                return
+        callbacks.append((ps5, callback))
 
     def remove_callback(self, ps5, callback):
         """Remove callback from list."""
-        if ps5.host in self.callbacks:
-            if self.callbacks[ps5.host][ps5] == callback:
-                self.callbacks[ps5.host].pop(ps5)
-
-                # If no callbacks remove host key also.
-                if not self.callbacks[ps5.host]:
-                    self.callbacks.pop(ps5.host)
+        callbacks = self.callbacks.get(ps5.host)
+        if callbacks is None:
+            return
+        if (ps5, callback) in callbacks:
+            callbacks.remove((ps5, callback))
+
+            # If no callbacks remove host key also.
+            if not callbacks:
+                self.callbacks.pop(ps5.host)
+
+    def get_callback(self, ps5):
+        """Return callback for PS5 Object or None."""
+        for _ps5, callback in self.callbacks.get(ps5.host, ()):
+            if _ps5 is ps5:
+                return callback
+        return None
 
     @property
     def local_port(self):
@@ -180,7 +211,9 @@ class DDPProtocol(asyncio.DatagramProtocol):
     @property
     def polls_disabled(self):
         """Return true if polls disabled."""
-        elapsed = time.time() - self._standby_start
+        if not self._standby_start:
+            return False
+        elapsed = time.monotonic() - self._standby_start
         if elapsed < DEFAULT_STANDBY_DELAY:
             return True
         self._standby_start = 0
@@ -190,15 +223,28 @@ class DDPProtocol(asyncio.DatagramProtocol):
 async def async_create_ddp_endpoint(sock=None, port=DEFAULT_UDP_PORT):
     """Create Async UDP endpoint."""
     loop = asyncio.get_event_loop()
-    if sock is None:
-        sock = get_socket(port=port)
-    sock.settimeout(0)
-    connect = loop.create_datagram_endpoint(
+    if sock is not None:
+        sock.settimeout(0)
+        return await loop.create_datagram_endpoint(
+            lambda: DDPProtocol(),  # noqa: pylint: disable=unnecessary-lambda
+            sock=sock,
+        )
+    try:
+        return await _async_bind_ddp_endpoint(loop, port)
+    except OSError as error:
+        _LOGGER.error(
+            "Error getting DDP socket with port: %s: %s", port, error)
+    return await _async_bind_ddp_endpoint(loop, UDP_PORT)
+
+
+async def _async_bind_ddp_endpoint(loop, port):
+    """Let the loop create and bind the DDP socket."""
+    return await loop.create_datagram_endpoint(
         lambda: DDPProtocol(),  # noqa: pylint: disable=unnecessary-lambda
-        sock=sock,
+        local_addr=(UDP_IP, port),
+        allow_broadcast=True,
+        reuse_port=hasattr(socket, "SO_REUSEPORT"),
     )
-    transport, protocol = await loop.create_task(connect)
-    return transport, protocol
 
 
 def get_ddp_message(msg_type, data=None):
@@ -206,64 +252,62 @@ def get_ddp_message(msg_type, data=None):
     if msg_type not in DDP_MSG_TYPES:
         raise TypeError(
             "DDP MSG type: '{}' is not a valid type".format(msg_type))
-    msg = u'{} * HTTP/1.1\n'.format(msg_type)
+    lines = ['{} * HTTP/1.1\n'.format(msg_type)]
     if data is not None:
-        for key, value in data.items():
-            msg += '{}:{}\n'.format(key, value)
-    msg += 'device-discovery-protocol-version:{}\n'.format(DDP_VERSION)
-    return msg
+        lines.extend(
+            '{}:{}\n'.format(key, value) for key, value in data.items())
+    lines.append('device-discovery-protocol-version:{}\n'.format(DDP_VERSION))
+    return ''.join(lines)
 
 
-def parse_ddp_response(rsp):
+def parse_ddp_response(rsp: bytes) -> dict:
     """Parse the response."""
     data = {}
-    if DDP_TYPE_SEARCH in rsp:
+    if rsp.startswith(_SEARCH_PREFIX):
         _LOGGER.info("Received %s message", DDP_TYPE_SEARCH)
         return data
-    app_name = None
-    for line in rsp.splitlines():
-        if 'running-app-name' in line:
-            app_name = line
-            app_name = app_name.replace('running-app-name:', '')
-        re_status = re.compile(r'HTTP/1.1 (?P<code>\d+) (?P<status>.*)')
+    # Bind lookups used per line to locals.
+    match_status = _RE_STATUS.match
+    status_prefix = _STATUS_PREFIX
+    setitem = data.__setitem__
+    for line in rsp.split(b'\n'):
         line = line.strip()
         # skip empty lines
         if not line:
             continue
-        if re_status.match(line):
-            data[u'status_code'] = int(re_status.match(line).group('code'))
-            data[u'status'] = re_status.match(line).group('status')
-        else:
-            values = line.split(':')
-            data[values[0]] = values[1]
-    if app_name is not None:
-        data['running-app-name'] = app_name
+        if line.startswith(status_prefix):
+            match = match_status(line)
+            if match:
+                setitem(u'status_code', int(match.group(1)))
+                setitem(u'status', match.group(2).decode('ascii', 'replace'))
+            continue
+        # Split on first colon only; values may contain colons.
+        key, sep, value = line.partition(b':')
+        if sep and key:
+            setitem(
+                key.decode('ascii', 'replace'),
+                value.strip().decode('utf-8', 'replace'))
     return data
 
 
-def get_ddp_search_message():
-    """Get DDP search message."""
-    return get_ddp_message(DDP_TYPE_SEARCH)
+@functools.lru_cache(maxsize=1)
+def get_ddp_search_message() -> bytes:
+    """Get encoded DDP search message."""
+    return get_ddp_message(DDP_TYPE_SEARCH).encode('utf-8')
 
 
-def get_ddp_wake_message(credential):
-    """Get DDP wake message."""
-    data = {
-        'user-credential': credential,
-        'client-type': 'a',
-        'auth-type': 'C',
-    }
-    return get_ddp_message(DDP_TYPE_WAKEUP, data)
+@functools.lru_cache(maxsize=8)
+def get_ddp_wake_message(credential) -> bytes:
+    """Get encoded DDP wake message."""
+    return _CREDENTIAL_MSG_TEMPLATE.format(
+        msg_type=DDP_TYPE_WAKEUP, credential=credential).encode('utf-8')
 
 
-def get_ddp_launch_message(credential):
-    """Get DDP launch message."""
-    data = {
-        'user-credential': credential,
-        'client-type': 'a',
-        'auth-type': 'C',
-    }
-    return get_ddp_message(DDP_TYPE_LAUNCH, data)
+@functools.lru_cache(maxsize=8)
+def get_ddp_launch_message(credential) -> bytes:
+    """Get encoded DDP launch message."""
+    return _CREDENTIAL_MSG_TEMPLATE.format(
+        msg_type=DDP_TYPE_LAUNCH, credential=credential).encode('utf-8')
 
 
 def get_socket(port: Optional[int] = DEFAULT_UDP_PORT):
@@ -274,9 +318,11 @@ def get_socket(port: Optional[int] = DEFAULT_UDP_PORT):
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         sock.settimeout(0)
         try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             if hasattr(socket, "SO_REUSEPORT"):
                 sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)  # noqa: pylint: disable=no-member
             sock.bind((UDP_IP, port))
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
         except socket.error as error:
             _LOGGER.error(
                 "Error getting DDP socket with port: %s: %s", port, error)
@@ -288,97 +334,72 @@ def get_socket(port: Optional[int] = DEFAULT_UDP_PORT):
     return sock
 
 
-def _send_recv_msg(
-        host,
-        msg,
-        receive=True,
-        send=True,
-        sock=None,
-        close=True):
-    """Send a ddp message and receive the response."""
-    response = None
-    if sock is None:
-        if not close:
-            raise ValueError("Unspecified sockets must be closed")
-        sock = get_socket()
-
-    if send:
-        if host == BROADCAST_IP:
-            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-            _LOGGER.debug("Broadcast enabled")
+def _ddp_send(host, msg, sock=None):
+    """Send a ddp message.
 
-        sock.sendto(msg.encode('utf-8'), (host, DDP_PORT))
+    An existing socket is reused and left open. Without one, a
+    temporary socket is created and closed after sending.
+    """
+    close = sock is None
+    if close:
+        sock = get_socket()
+    try:
+        sock.sendto(msg, (host, DDP_PORT))
         _LOGGER.debug(
             "SENT DDP MSG: SPORT=%s DEST=%s",
             sock.getsockname()[1], (host, DDP_PORT))
-
-    if receive:
-        available, _, _ = select.select([sock], [], [], 0.01)
-        if sock in available:
-            response = sock.recvfrom(1024)
-            _LOGGER.debug(
-                "RECV DDP MSG: DPORT=%s SRC=%s",
-                sock.getsockname()[1], response[1])
-    if close:
-        sock.close()
-    return response
-
-
-def _send_msg(host, msg, sock=None, close=True):
-    """Send a ddp message."""
-    return _send_recv_msg(
-        host,
-        msg,
-        receive=False,
-        send=True,
-        sock=sock,
-        close=close,
-    )
-
-
-def _recv_msg(host, msg, sock=None, close=True):
-    """Send a ddp message."""
-    return _send_recv_msg(
-        host,
-        msg,
-        receive=True,
-        send=False,
-        sock=sock,
-        close=close,
-    )
+    finally:
+        if close:
+            sock.close()
 
 
 def send_search_msg(host, sock=None):
     """Send SRCH message only."""
-    msg = get_ddp_search_message()
-    return _send_msg(host, msg, sock=sock)
+    _ddp_send(host, get_ddp_search_message(), sock)
 
 
-def search(host=BROADCAST_IP, port=UDP_PORT, sock=None, timeout=3) -> list:
-    """Return list of discovered PS5s."""
-    ps_list = []
+def xsearch(host=BROADCAST_IP, port=UDP_PORT, sock=None, timeout=3):
+    """Yield status dicts of PS5s as they respond.
+
+    Blocks in recvfrom until a response arrives or timeout elapses.
+    """
     msg = get_ddp_search_message()
-    start = time.time()
+    deadline = time.monotonic() + timeout
 
     if host is None:
         host = BROADCAST_IP
     if sock is None:
         sock = get_socket(port=port)
-    _LOGGER.debug("Sending search message")
-    _send_msg(host, msg, sock=sock, close=False)
-    while time.time() - start < timeout:
-        data = addr = None
-        response = _recv_msg(host, msg, sock=sock, close=False)
-        if response is not None:
-            data, addr = response
-        if data is not None and addr is not None:
-            data = parse_ddp_response(data.decode('utf-8'))
-            if data not in ps_list and data:
+    try:
+        _LOGGER.debug("Sending search message")
+        _ddp_send(host, msg, sock)
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            sock.settimeout(remaining)
+            try:
+                data, addr = sock.recvfrom(1024)
+            except socket.timeout:
+                break
+            _LOGGER.debug(
+                "RECV DDP MSG: DPORT=%s SRC=%s", sock.getsockname()[1], addr)
+            data = parse_ddp_response(data)
+            if data:
                 data[u'host-ip'] = addr[0]
-                ps_list.append(data)
+                yield data
             if host != BROADCAST_IP:
                 break
-    sock.close()
+    finally:
+        sock.close()
+
+
+def search(host=BROADCAST_IP, port=UDP_PORT, sock=None, timeout=3) -> list:
+    """Return list of discovered PS5s."""
+    ps_list = []
+    for data in xsearch(host=host, port=port, sock=sock, timeout=timeout):
+        if data not in ps_list:
+            ps_list.append(data)
     return ps_list
 
 
@@ -392,11 +413,9 @@ def get_status(host, port=UDP_PORT, sock=None):
 
 def wakeup(host, credential, sock=None):
     """Wakeup PS5."""
-    msg = get_ddp_wake_message(credential)
-    _send_msg(host, msg, sock)
+    _ddp_send(host, get_ddp_wake_message(credential), sock)
 
 
 def launch(host, credential, sock=None):
     """Launch."""
-    msg = get_ddp_launch_message(credential)
-    _send_msg(host, msg, sock)
+    _ddp_send(host, get_ddp_launch_message(credential), sock)
@@ -1,12 +1,14 @@
 """Helpers."""
+import functools
 import logging
 import os
 from pathlib import Path
-import json
 import socket
 import sysconfig
 import sys
 
+import orjson
+
 from .errors import NotReady, LoginFailed
 from .credential import Credentials, DEFAULT_DEVICE_NAME
 from .ddp import search, DDP_PORT, DEFAULT_UDP_PORT
@@ -32,6 +34,8 @@ class Helper:
 
     def __init__(self):
         """Init Class."""
+        self._data = {}
+        self._title_mapping = None
 
     def has_devices(self, host=None, port=DEFAULT_UDP_PORT) -> list:
         """Return list of device status dicts that are discovered."""
@@ -97,32 +101,37 @@ class Helper:
     def port_bind(self, ports: list) -> int:
         """Return port that are not able to bind.
 
-        Returns first port that fails.
+        Returns first port that fails. Blocking; run in an executor.
         :param ports: Ports to test
         """
         for port in ports:
-            try:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            if self._probe_port(port):
+                continue
+
+            if port == DDP_PORT:
+                error_str = "Error binding to port."
+                path_str = ''
+                if sys.platform == 'linux':
+                    py_path = self.get_exec_path()
+                    path_str = (
+                        " Try setcap command >"
+                        "setcap 'cap_net_bind_service=+ep' {}"
+                    ).format(py_path)
+                _LOGGER.error('%s%s', error_str, path_str)
+
+            return int(port)
+        return None
+
+    def _probe_port(self, port: int) -> bool:
+        """Return True if able to bind to port."""
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
                 sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
                 sock.settimeout(1)
                 sock.bind(('0.0.0.0', port))
-                sock.close()
-            except socket.error:
-                sock.close()
-
-                if port == DDP_PORT:
-                    error_str = "Error binding to port."
-                    path_str = ''
-                    if sys.platform == 'linux':
-                        py_path = self.get_exec_path()
-                        path_str = (
-                            " Try setcap command >"
-                            "setcap 'cap_net_bind_service=+ep' {}"
-                        ).format(py_path)
-                    _LOGGER.error('%s%s', error_str, path_str)
-
-                return int(port)
-            return None
+        except socket.error:
+            return False
+        return True
 
     def check_data(self, file_type=None, file_name=None) -> bool:
         """Return True if data is present in file.
@@ -131,10 +140,10 @@ class Helper:
         :param file_name: Name of file
         """
         if file_name is None:
-            file_name = self.check_files(file_type)
-        with open(file_name, "r") as _r_file:
-            data = json.load(_r_file)
-            _r_file.close()
+            data = self.load_files(file_type)
+        else:
+            with open(file_name, "rb") as _r_file:
+                data = orjson.loads(_r_file.read())
         if data:
             return True
         return False
@@ -150,21 +159,23 @@ class Helper:
         if file_type in FILE_TYPES:
             file_name = FILE_TYPES[file_type]
             if not os.path.isfile(file_name):
-                with open(file_name, "w+") as _file_name:
-                    json.dump(fp=_file_name, obj={})
-                    _file_name.close()
+                with open(file_name, "wb") as _file_name:
+                    _file_name.write(orjson.dumps({}))
             return file_name
         return None
 
     def load_files(self, file_type: str) -> dict:
         """Load data as JSON. Return data.
 
+        Data is read from disk once and kept until saved again.
         :param file_type: Type of file
         """
+        if file_type in self._data:
+            return self._data[file_type]
         file_name = self.check_files(file_type)
-        with open(file_name, "r") as _r_file:
-            data = json.load(_r_file)
-            _r_file.close()
+        with open(file_name, "rb") as _r_file:
+            data = orjson.loads(_r_file.read())
+        self._data[file_type] = data
         return data
 
     def save_files(self, data: dict, file_type=None) -> str:
@@ -181,26 +192,49 @@ class Helper:
             return None
 
         _data = data
-        with open(file_name, "w+") as _w_file:
-            json.dump(fp=_w_file, obj=_data)
-            _w_file.close()
+        with open(file_name, "wb") as _w_file:
+            _w_file.write(orjson.dumps(_data))
+        self._data[file_type] = _data
+        if file_type == 'games':
+            self._title_mapping = None
         return file_name
 
-    # noqa: pylint: disable=no-member
+    def get_title_mapping(self) -> dict:
+        """Return numbered titles to select from. Rebuilt after games save.
+
+        Maps index str to (title_id, title); '0' is Cancel.
+        """
+        if self._title_mapping is None:
+            mapping = {}
+            games = self.load_files('games')
+            if games:
+                mapping['0'] = ('', 'Cancel')
+                for g_index, (key, value) in enumerate(games.items(), 1):
+                    mapping[str(g_index)] = (key, value)
+            self._title_mapping = mapping
+        return self._title_mapping
+
     def get_exec_path(self) -> str:
         """Return correct exec path for setcap util."""
-        try:
-            config = sysconfig.get_config_vars()
-            base = config['projectbase']
-            version = config['py_version_short']
-            py_str = '/python'
-            py_path = '{}{}{}'.format(
-                base,
-                py_str,
-                version,
-            )
-            if not Path(py_path).is_symlink():
-                return py_path
-        except (KeyError, AttributeError):
-            _LOGGER.debug("Error retrieving exec path")
-        return sys.executable
+        return _get_exec_path()
+
+
+# noqa: pylint: disable=no-member
+@functools.lru_cache(maxsize=None)
+def _get_exec_path() -> str:
+    """Return exec path. Computed once on first use."""
+    try:
+        config = sysconfig.get_config_vars()
+        base = config['projectbase']
+        version = config['py_version_short']
+        py_str = '/python'
+        py_path = '{}{}{}'.format(
+            base,
+            py_str,
+            version,
+        )
+        if not Path(py_path).is_symlink():
+            return py_path
+    except (KeyError, AttributeError):
+        _LOGGER.debug("Error retrieving exec path")
+    return sys.executable
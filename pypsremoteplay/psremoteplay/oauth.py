@@ -1,9 +1,11 @@
 """OAuth methods for getting PSN credentials."""
 import logging
 import asyncio
-import base64
-from urllib.parse import urlparse, parse_qs
-from Cryptodome.Hash import SHA256
+import binascii
+import hashlib
+import struct
+from types import MappingProxyType
+from urllib.parse import unquote_plus, urlsplit
 
 import aiohttp
 
@@ -27,29 +29,29 @@ LOGIN_URL = (
 )
 
 TOKEN_URL = "https://auth.api.sonyentertainmentnetwork.com/2.0/oauth/token"
-TOKEN_BODY = (
-    'grant_type=authorization_code'
-    '&code={}'
-    '&redirect_uri=https://remoteplay.dl.playstation.net/remoteplay/redirect&'
+_ACCOUNT_URL_PREFIX = TOKEN_URL + '/'
+TOKEN_BODY_PREFIX = b'grant_type=authorization_code&code='
+TOKEN_BODY_SUFFIX = (
+    b'&redirect_uri=https://remoteplay.dl.playstation.net/remoteplay/redirect&'
 )
-HEADERS = {
+HEADERS = MappingProxyType({
     "Content-Type": "application/x-www-form-urlencoded"
-}
+})
+
+_VALID_ENCODINGS = frozenset(('base64', 'sha256'))
 
 logging.basicConfig(level=logging.INFO)
 _LOGGER = logging.getLogger(__name__)
 
 
-def get_user_account(redirect_url: str, loop=None):
+def get_user_account(redirect_url: str):
     """Return Account. Use async_get_user_account if from loop."""
-    if loop is None:
-        loop = asyncio.get_event_loop()
-        if not loop.is_running():
-            task = asyncio.ensure_future(async_get_user_account(redirect_url))
-            account = loop.run_until_complete(task)
-    else:
-        account = loop.create_task(async_get_user_account(redirect_url))
-    return account
+    # Same as asyncio.run, which needs Python 3.7.
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(async_get_user_account(redirect_url))
+    finally:
+        loop.close()
 
 
 async def async_get_user_account(redirect_url: str) -> dict:
@@ -57,59 +59,58 @@ async def async_get_user_account(redirect_url: str) -> dict:
     code = _parse_redirect_url(redirect_url)
     if code is None:
         return None
-    token = await _get_token(code)
-    if token is None:
-        return None
-    account = await _fetch_account_info(token)
+    # One session so both requests share the connection to the auth host.
+    async with aiohttp.ClientSession(
+            auth=aiohttp.BasicAuth(CLIENT_ID, password=CLIENT_SECRET),
+            headers=HEADERS,
+            timeout=aiohttp.ClientTimeout(total=3),
+            raise_for_status=False) as session:
+        token = await _get_token(session, code)
+        if token is None:
+            return None
+        account = await _fetch_account_info(session, token)
     return account
 
 
-async def _get_token(code):
+async def _get_token(session, code):
     _LOGGER.debug("Sending POST request")
-    auth = aiohttp.BasicAuth(CLIENT_ID, password=CLIENT_SECRET)
-    body = TOKEN_BODY.format(code).encode('ascii')
-    async with aiohttp.ClientSession() as session:
-        async with session.post(
-                url=TOKEN_URL, auth=auth,
-                headers=HEADERS, data=body, timeout=3) as resp:
-            if resp.status == 200:
-                content = await resp.json()
-                token = content.get('access_token')
-                return token
-            _LOGGER.error(
-                "Error getting token. Got response: %s", resp.status)
-            await resp.release()
-            return None
+    body = TOKEN_BODY_PREFIX + code.encode('ascii') + TOKEN_BODY_SUFFIX
+    async with session.post(TOKEN_URL, data=body) as resp:
+        if resp.status == 200:
+            content = await resp.json()
+            token = content.get('access_token')
+            return token
+        _LOGGER.error(
+            "Error getting token. Got response: %s", resp.status)
+        return None
 
 
-async def _fetch_account_info(token):
-    auth = aiohttp.BasicAuth(CLIENT_ID, password=CLIENT_SECRET)
-    async with aiohttp.ClientSession() as session:
-        async with session.get(
-                url='{}/{}'.format(TOKEN_URL, token),
-                auth=auth, timeout=3) as resp:
-            if resp.status == 200:
-                account_info = await resp.json()
-                user_id = account_info.get('user_id')
-                user_b64 = _format_user_id(user_id, 'base64')
-                user_creds = _format_user_id(user_id, 'sha256')
-                account_info['user_rpid'] = user_b64
-                account_info['credentials'] = user_creds
-                return account_info
-            _LOGGER.error(
-                "Error getting account. Got response: %s", resp.status)
-            await resp.release()
-            return None
+async def _fetch_account_info(session, token):
+    async with session.get(_ACCOUNT_URL_PREFIX + token) as resp:
+        if resp.status == 200:
+            account_info = await resp.json()
+            user_id = account_info.get('user_id')
+            user_b64 = _format_user_id(user_id, 'base64')
+            user_creds = _format_user_id(user_id, 'sha256')
+            account_info['user_rpid'] = user_b64
+            account_info['credentials'] = user_creds
+            return account_info
+        _LOGGER.error(
+            "Error getting account. Got response: %s", resp.status)
+        return None
 
 
 def _parse_redirect_url(redirect_url):
-    code_url = urlparse(redirect_url)
-    query = parse_qs(code_url.query)
-    code = query.get('code')
+    query = urlsplit(redirect_url).query
+    code = None
+    for param in query.split('&'):
+        name, _, value = param.partition('=')
+        if name == 'code':
+            code = unquote_plus(value)
+            break
     if code is None:
         _LOGGER.error("Code not in query")
         return None
-    code = code[0]
     if len(code) <= 1:
         _LOGGER.error("Code is too short")
         return None
@@ -119,18 +120,16 @@ def _parse_redirect_url(redirect_url):
 
 def _format_user_id(user_id: str, encoding='base64'):
     """Format user id into useable encoding."""
-    valid_encodings = {'base64', 'sha256'}
-    if encoding not in valid_encodings:
+    if encoding not in _VALID_ENCODINGS:
         raise TypeError("{} encoding is not valid. Use {}".format(
-            encoding, valid_encodings))
+            encoding, ', '.join(sorted(_VALID_ENCODINGS))))
 
     if user_id is not None:
         if encoding == 'sha256':
-            user_id = SHA256.new(user_id.encode())
-            user_id = user_id.digest().hex()
+            user_id = hashlib.sha256(user_id.encode()).hexdigest()
         elif encoding == 'base64':
-            user_id = base64.b64encode(
-                int(user_id).to_bytes(8, "little")).decode()
+            user_id = binascii.b2a_base64(
+                struct.pack('<Q', int(user_id)), newline=False).decode('ascii')
     return user_id
 
 
@@ -145,6 +144,9 @@ def _prompt():
     redirect_url = input(msg)
     if redirect_url is not None:
         account_info = get_user_account(redirect_url)
+        if account_info is None:
+            print("\r\n\r\nCould not get account info.")
+            return
         user_id = account_info.get('credentials')
         print("\r\n\r\nYour account id is: '{}'".format(user_id))
 
@@ -261,12 +261,20 @@ class Ps5Legacy(Ps5Base):
     def launch(self):
         """Send Launch Packet."""
         sock = self._get_socket()
-        launch(self.host, self.credential, sock=sock)
+        try:
+            launch(self.host, self.credential, sock=sock)
+        finally:
+            if sock is not None:
+                sock.close()
 
     def wakeup(self):
         """Send Wakeup Packet."""
         sock = self._get_socket()
-        wakeup(self.host, self.credential, sock=sock)
+        try:
+            wakeup(self.host, self.credential, sock=sock)
+        finally:
+            if sock is not None:
+                sock.close()
         self._power_on = True
 
     def login(self, pin: Optional[str] = '') -> bool:
@@ -392,9 +400,8 @@ class Ps5Async(Ps5Base):
         protocol = None
         callback = None
         if self.ddp_protocol is not None:
-            host = self.ddp_protocol.callbacks.get(self.host)
-            if host is not None:
-                callback = host.get(self)
+            callback = self.ddp_protocol.get_callback(self)
+            if callback is not None:
                 self.ddp_protocol.remove_callback(self, callback)
             protocol = self.ddp_protocol
             self.ddp_protocol = None
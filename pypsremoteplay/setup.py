@@ -4,12 +4,13 @@
 from setuptools import find_packages, setup
 
 version = {}
-with open("./psremoteplay/__version__.py") as f:
+with open("./psremoteplay/__version__.py", encoding="utf-8") as f:
     exec(f.read(), version)
 
 MIN_PY_VERSION = '.'.join(map(str, version['REQUIRED_PYTHON_VER']))
 
-REQUIRES = list(open('requirements.txt'))
+with open('requirements.txt', encoding='utf-8') as f:
+    REQUIRES = [line for line in f.read().splitlines() if line]
 
 CLASSIFIERS = [
     'Development Status :: 5 - Production/Stable',